@@ -1,7 +1,8 @@
+import os
+import tempfile
 from pathlib import Path
 
 path = Path("src/components/tournaments/tournament-playoffs.tsx")
-data = path.read_text()
 old = """          {mainMatches.length === 0 ? (
             <p className="rounded-lg bg-slate-50 px-3 py-2 text-sm text-slate-600">
               Todavia no hay llaves generadas para esta categoria.
@@ -181,7 +182,16 @@ new = """          {mainMatches.length === 0 ? (
             </div>
           )}
 """
-if old not in data:
+with open(path, "rb") as src:
+    data = src.read()
+old_bytes = old.encode()
+new_bytes = new.encode()
+idx = data.find(old_bytes)
+if idx < 0:
     raise SystemExit("block not found")
-path.write_text(data.replace(old, new, 1))
-"""
+with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as tmp:
+    tmp.write(data[:idx])
+    tmp.write(new_bytes)
+    tmp.write(data[idx + len(old_bytes):])
+os.chmod(tmp.name, os.stat(path).st_mode)
+os.replace(tmp.name, path)